@@ -20,102 +20,621 @@ defs, syns, ants = lookup_word("algorithm")
 
 Notes:
 - PyDictionary relies on WordNet and web sources; responses can vary by connectivity.
+- If NLTK is installed (`pip install speak-meaning[wordnet]`), the local WordNet corpus is used
+  first and PyDictionary is only consulted for words WordNet doesn't know. Lookups never
+  download the corpus; call `download_wordnet()` up front (the GUI does so at startup).
 - Network calls are wrapped and sanitized; callers should expect None/empty outputs on failures.
+- PyDictionary's HTTP requests share one pooled keep-alive `requests.Session`.
+- Lookups are cached in-process (W-TinyLFU) and on disk (SQLite under the user cache dir) so
+  repeat words skip the network across restarts.
+- Lookup order is in-process cache -> WordNet -> disk cache -> PyDictionary. WordNet is checked
+  before the disk so that, once installed, it supersedes web answers cached earlier; its own
+  answers are local already and are not written to disk.
 =========================================================================================================
 """
 from __future__ import annotations
 
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from typing import Dict, List, Tuple, Optional
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 try:
     from PyDictionary import PyDictionary  # type: ignore
 except Exception:  # pragma: no cover - import-time environment issues
     PyDictionary = None  # type: ignore
 
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except Exception:  # pragma: no cover - import-time environment issues
+    requests = None  # type: ignore
+
+try:
+    import nltk  # type: ignore
+    from nltk.corpus import wordnet  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    nltk = None  # type: ignore
+    wordnet = None  # type: ignore
+
+try:
+    from platformdirs import user_cache_dir  # type: ignore
+except Exception:  # pragma: no cover - import-time environment issues
+    user_cache_dir = None  # type: ignore
+
+# Meanings are stored as immutable (part_of_speech, definitions) pairs: smaller than a
+# dict of lists when hundreds are cached, and safe to share between callers.
+Meanings = Tuple[Tuple[str, Tuple[str, ...]], ...]
+LookupResult = Tuple[Meanings, List[str], List[str]]
+
+_MISSING = object()
+
+# Complete answers are kept for an hour; ones where a source failed (often a transient
+# network error) for a minute, and are never written to disk.
+_POSITIVE_TTL = 3600.0
+_NEGATIVE_TTL = 60.0
+# Disk rows are re-fetched after a week, so a bad answer can't stick forever.
+_DISK_TTL = 7 * 86400.0
+
+# Shared pool for fanning out the three independent PyDictionary calls of a lookup.
+_FETCH_POOL = ThreadPoolExecutor(max_workers=3, thread_name_prefix="speak-meaning-fetch")
+# Set on threads doing background prefetches, which fetch serially and leave _FETCH_POOL
+# free for user-initiated lookups.
+_BACKGROUND = threading.local()
+
+
+def _cache_read(cache: "_TinyLFUCache", key: Hashable) -> Any:
+    """Read *key* from *cache*; background prefetches peek so they don't count as an access."""
+    if getattr(_BACKGROUND, "active", False):
+        return cache.peek(key, _MISSING)
+    return cache.get(key, _MISSING)
+
+
+class _TinyLFUCache:
+    """Bounded, thread-safe W-TinyLFU cache.
+
+    New keys land in a small LRU window; when the window overflows, its victim only enters
+    the main segmented LRU (probation + protected) if a Count-Min Sketch says it has been
+    requested at least as often as the main segment's own eviction victim. This keeps
+    frequently used words resident through bursts of one-off lookups.
+    """
+
+    _MAX_COUNT = 15  # 4-bit counters
+    # One odd 64-bit multiplier per sketch row; the top bits of hash * seed pick the slot.
+    _SEEDS = (0xC3A5C85C97CB3127, 0xB492B66FBE98F273, 0x9AE16A3B2F90404F, 0xCBF29CE484222325)
+    _MASK64 = (1 << 64) - 1
+
+    def __init__(self, maxsize: int = 512) -> None:
+        self._maxsize = max(3, maxsize)
+        self._window_cap = max(1, self._maxsize // 100)
+        main_cap = self._maxsize - self._window_cap
+        self._protected_cap = max(1, int(main_cap * 0.8))
+        self._main_cap = main_cap
+        self._window: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._probation: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._protected: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+        bits = 1
+        while (1 << bits) < self._maxsize * 4:
+            bits += 1
+        self._shift = 64 - bits
+        self._sketch = [bytearray(1 << bits) for _ in self._SEEDS]
+        self._additions = 0
+        self._sample_size = self._maxsize * 10
+        self._lock = threading.Lock()
+
+    # Frequency sketch
+    def _indexes(self, key: Hashable) -> List[int]:
+        h = hash(key) & self._MASK64
+        h ^= h >> 32
+        return [((h * seed) & self._MASK64) >> self._shift for seed in self._SEEDS]
+
+    def _increment(self, key: Hashable) -> None:
+        for row, idx in zip(self._sketch, self._indexes(key)):
+            if row[idx] < self._MAX_COUNT:
+                row[idx] += 1
+        self._additions += 1
+        if self._additions >= self._sample_size:
+            # Periodic aging so stale popularity fades out.
+            for row in self._sketch:
+                row[:] = bytes(c >> 1 for c in row)
+            self._additions //= 2
+
+    def _frequency(self, key: Hashable) -> int:
+        return min(row[idx] for row, idx in zip(self._sketch, self._indexes(key)))
+
+    # Mapping-ish API
+    def _segment_of(self, key: Hashable) -> Optional["OrderedDict[Hashable, Any]"]:
+        """Return the segment holding a live entry for *key*, dropping it if expired."""
+        for segment in (self._window, self._protected, self._probation):
+            if key in segment:
+                expires_at = segment[key][0]
+                if expires_at is not None and expires_at <= time.monotonic():
+                    del segment[key]
+                    return None
+                return segment
+        return None
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return self._segment_of(key) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._window) + len(self._probation) + len(self._protected)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            self._increment(key)
+            segment = self._segment_of(key)
+            if segment is None:
+                return default
+            if segment is self._probation:
+                entry = self._probation.pop(key)
+                self._protected[key] = entry
+                if len(self._protected) > self._protected_cap:
+                    demoted, demoted_entry = self._protected.popitem(last=False)
+                    self._probation[demoted] = demoted_entry
+                return entry[1]
+            segment.move_to_end(key)
+            return segment[key][1]
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Like `get`, but without counting an access or promoting the entry."""
+        with self._lock:
+            segment = self._segment_of(key)
+            return default if segment is None else segment[key][1]
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store *value*; with *ttl* (seconds) the entry expires and reads as a miss."""
+        entry = (None if ttl is None else time.monotonic() + ttl, value)
+        with self._lock:
+            for segment in (self._window, self._probation, self._protected):
+                if key in segment:
+                    segment[key] = entry
+                    segment.move_to_end(key)
+                    return
+            self._window[key] = entry
+            if len(self._window) <= self._window_cap:
+                return
+            candidate, candidate_entry = self._window.popitem(last=False)
+            if len(self._probation) + len(self._protected) < self._main_cap:
+                self._probation[candidate] = candidate_entry
+                return
+            victims = self._probation or self._protected
+            victim = next(iter(victims))
+            if self._frequency(candidate) >= self._frequency(victim):
+                del victims[victim]
+                self._probation[candidate] = candidate_entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._window.clear()
+            self._probation.clear()
+            self._protected.clear()
+
+
+def _default_cache_path() -> str:
+    if user_cache_dir is not None:
+        base = user_cache_dir("speak_meaning")
+    else:  # pragma: no cover - platformdirs is a declared dependency
+        # Last resort only: XDG layout, which is not the native location on Windows/macOS.
+        base = os.path.join(
+            os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "speak_meaning"
+        )
+    return os.path.join(base, "lookups.sqlite3")
+
+
+class _DiskCache:
+    """Persistent SQLite store of lookup results, keyed by normalized word.
+
+    Failures (read-only home, locked DB, corrupt rows) degrade to cache misses.
+    """
+
+    _shared: Optional["_DiskCache"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, path: str) -> None:
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS lookups ("
+                "word TEXT PRIMARY KEY, meanings BLOB, syns BLOB, ants BLOB, fetched_at REAL)"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(lookups)")}
+            if "fetched_at" not in columns:  # databases created before the column existed
+                conn.execute("ALTER TABLE lookups ADD COLUMN fetched_at REAL")
+            conn.commit()
+            self._conn = conn
+        except (OSError, sqlite3.Error):
+            self._conn = None
+
+    @classmethod
+    def shared(cls) -> "_DiskCache":
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(_default_cache_path())
+            return cls._shared
+
+    def get(self, word: str) -> Optional[LookupResult]:
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT meanings, syns, ants, fetched_at FROM lookups WHERE word = ?", (word,)
+                ).fetchone()
+            if row is None or time.time() - (row[3] or 0.0) >= _DISK_TTL:
+                return None  # rows from before fetched_at existed count as expired
+            return _compact_meanings(json.loads(row[0])), json.loads(row[1]), json.loads(row[2])
+        except (sqlite3.Error, ValueError, TypeError):
+            return None
+
+    def put(self, word: str, result: LookupResult) -> None:
+        if self._conn is None:
+            return
+        meanings, syns, ants = result
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO lookups (word, meanings, syns, ants, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (word, json.dumps(meanings), json.dumps(syns), json.dumps(ants), time.time()),
+                )
+                self._conn.commit()
+        except (sqlite3.Error, TypeError, ValueError):
+            pass
+
+
+_HTTP_TIMEOUT = 10.0  # seconds; PyDictionary itself never sets one
+
+
+class _PooledRequests:
+    """Stand-in for the `requests` module inside PyDictionary that routes GETs through one Session."""
+
+    def __init__(self, session: "requests.Session") -> None:
+        self._session = session
+
+    def get(self, url: str, **kwargs: Any) -> "requests.Response":
+        kwargs.setdefault("timeout", _HTTP_TIMEOUT)
+        return self._session.get(url, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(requests, name)
+
+
+@lru_cache(maxsize=1)
+def _install_shared_session() -> None:
+    """Point PyDictionary's page fetches at a shared keep-alive session (once per process).
+
+    PyDictionary calls `requests.get` per lookup, paying a fresh TCP + TLS handshake each
+    time; pooling lets the concurrent meaning/synonym/antonym fetches reuse connections.
+    """
+    utils = sys.modules.get("PyDictionary.utils")
+    if requests is None or utils is None or getattr(utils, "requests", None) is not requests:
+        return  # Unknown PyDictionary layout; leave it alone
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    utils.requests = _PooledRequests(session)
+
+
+# WordNet POS tags mapped to the part-of-speech labels PyDictionary uses.
+_WORDNET_POS = {"n": "Noun", "v": "Verb", "a": "Adjective", "s": "Adjective", "r": "Adverb"}
+
+
+# NLTK's lazy corpus loader isn't safe to trigger from several threads at once.
+_WORDNET_LOCK = threading.Lock()
+
+
+def _local_wordnet() -> Any:
+    """Return the NLTK WordNet reader if its corpus is installed, else None. Never downloads."""
+    if wordnet is None:
+        return None
+    with _WORDNET_LOCK:
+        try:
+            wordnet.ensure_loaded()  # A no-op once loaded
+        except Exception:  # LookupError when the corpus is missing
+            return None
+    return wordnet
+
+
+def wordnet_downloadable() -> bool:
+    """True if NLTK is installed but the WordNet corpus isn't, i.e. `download_wordnet()` would help."""
+    return wordnet is not None and _local_wordnet() is None
+
+
+def download_wordnet() -> bool:
+    """Fetch the WordNet corpus if it's missing; True if WordNet is usable afterwards.
+
+    Blocks on the network, so call it from a background thread.
+    """
+    if not wordnet_downloadable():
+        return wordnet is not None
+    try:
+        nltk.download("wordnet", quiet=True)
+    except Exception:
+        return False
+    return _local_wordnet() is not None
+
+
+def _compact_meanings(
+    meanings: Union[Mapping[str, Sequence[str]], Iterable[Tuple[str, Sequence[str]]]]
+) -> Meanings:
+    """Convert a {pos: [definitions]} mapping (or pairs) to `Meanings`, dropping junk values."""
+    pairs = meanings.items() if isinstance(meanings, Mapping) else meanings
+    return tuple(
+        (pos, tuple(d for d in defs if isinstance(d, str) and d.strip()))
+        for pos, defs in pairs
+        if isinstance(defs, (list, tuple))
+    )
+
+
+def _unique_terms(terms: List[str]) -> List[str]:
+    """Strip and de-duplicate terms in one pass, keeping the source's relevance order."""
+    return list(dict.fromkeys(t.strip() for t in terms if isinstance(t, str) and t.strip()))
+
 
 class DictionaryClient:
     """Thin wrapper around PyDictionary with formatting helpers."""
 
-    def __init__(self) -> None:
-        if PyDictionary is None:
-            raise RuntimeError(
-                "PyDictionary is not available. Please install it via `pip install PyDictionary`."
-            )
-        self._client = PyDictionary()
+    def __init__(
+        self, backend: Any = None, disk: Optional[_DiskCache] = None, wordnet: Any = _MISSING
+    ) -> None:
+        """Defaults wire up PyDictionary, the shared disk cache and the local WordNet corpus.
+
+        *backend* (a PyDictionary-like object), *disk* and *wordnet* (an NLTK-style reader, or
+        None to disable it) can be passed explicitly, e.g. to run without the network. By default
+        WordNet is picked up as soon as its corpus is installed, even after construction.
+        """
+        if backend is None:
+            if PyDictionary is None:
+                raise RuntimeError(
+                    "PyDictionary is not available. Please install it via `pip install PyDictionary`."
+                )
+            _install_shared_session()
+            backend = PyDictionary()
+        self._client = backend
+        self._disk = _DiskCache.shared() if disk is None else disk
+        self._wordnet = wordnet
+        # One L1 entry per word holding all three parts, in front of the disk cache.
+        self._cache = _TinyLFUCache(maxsize=512)
 
     @staticmethod
     def _normalize_word(word: str) -> str:
-        return (word or "").strip().lower()
+        return word.strip().casefold() if word else ""
 
-    @lru_cache(maxsize=512)
-    def meanings(self, word: str) -> Dict[str, List[str]]:
-        word = self._normalize_word(word)
-        if not word:
-            return {}
+    # The _fetch_* helpers return None when the source failed. PyDictionary swallows its own
+    # errors: meaning() returns None only when its request failed, but synonym()/antonym()
+    # also return None for words that simply have none, so for those None means "none found"
+    # (stale answers age out of the disk cache via _DISK_TTL).
+    def _fetch_meanings(self, word: str) -> Optional[Meanings]:
         try:
-            meanings = self._client.meaning(word) or {}
-            # Ensure values are lists of strings
-            return {
-                pos: [d for d in defs if isinstance(d, str) and d.strip()]
-                for pos, defs in meanings.items()
-                if isinstance(defs, list)
-            }
+            meanings = self._client.meaning(word)
         except Exception:
-            return {}
+            return None
+        return None if meanings is None else _compact_meanings(meanings)
 
-    @lru_cache(maxsize=512)
-    def synonyms(self, word: str) -> List[str]:
-        word = self._normalize_word(word)
-        if not word:
-            return []
+    def _fetch_synonyms(self, word: str) -> Optional[List[str]]:
         try:
-            syns = self._client.synonym(word) or []
-            return sorted({s.strip() for s in syns if isinstance(s, str) and s.strip()})
+            syns = self._client.synonym(word)
         except Exception:
-            return []
+            return None
+        return _unique_terms(syns or [])
 
-    @lru_cache(maxsize=512)
-    def antonyms(self, word: str) -> List[str]:
-        word = self._normalize_word(word)
-        if not word:
-            return []
+    def _fetch_antonyms(self, word: str) -> Optional[List[str]]:
+        try:
+            ants = self._client.antonym(word)
+        except Exception:
+            return None
+        return _unique_terms(ants or [])
+
+    def _wordnet_lookup(self, word: str) -> Optional[LookupResult]:
+        """Answer from the local WordNet corpus, or None if it doesn't know *word*."""
+        reader = _local_wordnet() if self._wordnet is _MISSING else self._wordnet
+        if reader is None:
+            return None
         try:
-            ants = self._client.antonym(word) or []
-            return sorted({a.strip() for a in ants if isinstance(a, str) and a.strip()})
+            # WordNet spells multi-word lemmas with underscores ("ice_cream").
+            synsets = reader.synsets(word.replace(" ", "_"))
         except Exception:
-            return []
+            return None
+        if not synsets:
+            return None
+        meanings: Dict[str, List[str]] = {}
+        syns: List[str] = []
+        ants: List[str] = []
+        for synset in synsets:
+            pos = _WORDNET_POS.get(synset.pos(), synset.pos())
+            meanings.setdefault(pos, []).append(synset.definition())
+            for lemma in synset.lemmas():
+                syns.append(lemma.name().replace("_", " "))
+                ants.extend(a.name().replace("_", " ") for a in lemma.antonyms())
+        syns = [s for s in _unique_terms(syns) if s.casefold() != word]
+        return _compact_meanings(meanings), syns, _unique_terms(ants)
+
+    def _fetch(self, key: str) -> Tuple[LookupResult, bool]:
+        """Fetch all three parts from PyDictionary; the flag is False if any source failed."""
+        if getattr(_BACKGROUND, "active", False):
+            meanings = self._fetch_meanings(key)
+            syns = self._fetch_synonyms(key)
+            ants = self._fetch_antonyms(key)
+        else:
+            # Three independent round-trips; run them concurrently.
+            f_m = _FETCH_POOL.submit(self._fetch_meanings, key)
+            f_s = _FETCH_POOL.submit(self._fetch_synonyms, key)
+            f_a = _FETCH_POOL.submit(self._fetch_antonyms, key)
+            meanings, syns, ants = f_m.result(), f_s.result(), f_a.result()
+        complete = meanings is not None and syns is not None and ants is not None
+        return (meanings or (), syns or [], ants or []), complete
+
+    def _lookup_entry(self, key: str) -> Tuple[LookupResult, bool]:
+        """Return (result, complete) for a normalized *key*; incomplete entries expire quickly."""
+        # `key` must already be normalized so equivalent spellings share one cache slot.
+        if not key:
+            return ((), [], []), True
+        entry = _cache_read(self._cache, key)
+        if entry is not _MISSING:
+            return entry
+        # L1 miss: WordNet, then the disk cache, then the network (see the module notes).
+        result = self._wordnet_lookup(key)
+        if result is None:
+            result = self._disk.get(key)
+        if result is not None:
+            entry = result, True
+        else:
+            entry = self._fetch(key)
+            if entry[1]:
+                self._disk.put(key, entry[0])
+        self._cache.put(key, entry, ttl=_POSITIVE_TTL if entry[1] else _NEGATIVE_TTL)
+        return entry
+
+    def _lookup_cached(self, key: str) -> LookupResult:
+        return self._lookup_entry(key)[0]
+
+    def meanings(self, word: str) -> Meanings:
+        return self._lookup_cached(self._normalize_word(word))[0]
+
+    def synonyms(self, word: str) -> List[str]:
+        return self._lookup_cached(self._normalize_word(word))[1]
+
+    def antonyms(self, word: str) -> List[str]:
+        return self._lookup_cached(self._normalize_word(word))[2]
+
+    def lookup(self, word: str) -> LookupResult:
+        return self._lookup_cached(self._normalize_word(word))
 
-    def lookup(self, word: str) -> Tuple[Dict[str, List[str]], List[str], List[str]]:
-        return self.meanings(word), self.synonyms(word), self.antonyms(word)
 
+MeaningsLike = Union[Meanings, Mapping[str, Sequence[str]]]
 
-def format_meanings(meanings: Dict[str, List[str]]) -> str:
-    """Render meanings dict to a human-friendly text block."""
+
+def format_meanings(meanings: MeaningsLike) -> str:
+    """Render meanings (compact pairs or a {pos: [definitions]} dict) to a text block."""
     if not meanings:
         return "No definitions found."
-    lines: List[str] = []
-    for pos, defs in sorted(meanings.items()):
-        lines.append(f"{pos}:")
-        for i, d in enumerate(defs[:10], start=1):
-            lines.append(f"  {i}. {d}")
-        lines.append("")  # spacing between parts of speech
-    return "\n".join(lines).strip()
+    pairs = meanings.items() if isinstance(meanings, Mapping) else meanings
+
+    def lines() -> Iterator[str]:
+        for pos, defs in sorted(pairs):
+            yield f"{pos}:"
+            for i, d in enumerate(defs[:10], start=1):
+                yield f"  {i}. {d}"
+            yield ""  # spacing between parts of speech
+
+    # Only the trailing spacer needs trimming.
+    return "\n".join(lines()).rstrip()
 
 
 def format_word_summary(
-    word: str, meanings: Dict[str, List[str]], syns: List[str], ants: List[str]
+    word: str, meanings: MeaningsLike, syns: List[str], ants: List[str]
 ) -> str:
-    blocks: List[str] = [f"Word: {word}\n"]
-    blocks.append("Definitions:\n" + format_meanings(meanings))
+    return _summary_header(word) + _format_summary_body(meanings, syns, ants)
+
+
+def _summary_header(word: str) -> str:
+    return f"Word: {word}\n\n"
+
+
+def _format_summary_body(meanings: MeaningsLike, syns: List[str], ants: List[str]) -> str:
+    """Everything below the "Word:" header; independent of how the word was typed."""
+    blocks: List[str] = ["Definitions:\n" + format_meanings(meanings)]
     if syns:
-        blocks.append("\nSynonyms:\n" + ", ".join(syns[:20]))
+        blocks.append("\nSynonyms:\n" + ", ".join(syns[:15]))
     if ants:
-        blocks.append("\nAntonyms:\n" + ", ".join(ants[:20]))
+        blocks.append("\nAntonyms:\n" + ", ".join(ants[:15]))
     return "\n".join(blocks).strip()
 
 
+@lru_cache(maxsize=1)
+def _client() -> DictionaryClient:
+    # One shared client so its in-process cache survives across calls.
+    return DictionaryClient()
+
+
 # Public API
-def lookup_word(word: str) -> Tuple[Dict[str, List[str]], List[str], List[str]]:
-    client = DictionaryClient()
-    return client.lookup(word)
+def lookup_word(word: str) -> LookupResult:
+    return _client().lookup(word)
+
+
+def _lookup_with_status(key: str) -> Tuple[LookupResult, bool]:
+    return _client()._lookup_entry(key)
+
+
+# Rendered summary bodies plus their synonyms, keyed by normalized word.
+_SUMMARY_CACHE = _TinyLFUCache(maxsize=512)
+
+
+def _summary_entry(key: str) -> Tuple[str, List[str]]:
+    entry = _cache_read(_SUMMARY_CACHE, key)
+    if entry is _MISSING:
+        (meanings, syns, ants), complete = _lookup_with_status(key)
+        entry = _format_summary_body(meanings, syns, ants), syns
+        _SUMMARY_CACHE.put(key, entry, ttl=_POSITIVE_TTL if complete else _NEGATIVE_TTL)
+    return entry
+
+
+def cached_summary(word: str) -> str:
+    """Return the rendered summary for *word*, skipping lookup and formatting on repeats.
+
+    The cache is keyed by the normalized word, but the header echoes *word* as typed (stripped).
+    """
+    body = _summary_entry(DictionaryClient._normalize_word(word))[0]
+    return _summary_header((word or "").strip()) + body
+
+
+def prefetch_summary(word: str) -> None:
+    """Warm `cached_summary(word)` on the calling thread without using the shared fetch pool.
+
+    Meant for background threads: the fetches run serially here, so they never queue ahead of
+    a user's lookup and never occupy the pool's (non-daemon) worker threads at shutdown. Cache
+    reads don't count as accesses, so speculative words can't outrank ones the user looked up.
+    """
+    _BACKGROUND.active = True
+    try:
+        cached_summary(word)
+    finally:
+        _BACKGROUND.active = False
+
+
+def is_cached(word: str) -> bool:
+    """True if `cached_summary(word)` would be answered without a lookup."""
+    return DictionaryClient._normalize_word(word) in _SUMMARY_CACHE
+
+
+def related_words(word: str, limit: int = 5) -> List[str]:
+    """Likely next queries for an already-summarized *word*: its top single-word synonyms.
+
+    Never triggers a lookup; returns an empty list if *word* isn't cached.
+    """
+    key = DictionaryClient._normalize_word(word)
+    # peek: the search that produced this entry already counted as an access.
+    entry = _SUMMARY_CACHE.peek(key, _MISSING)
+    if entry is _MISSING:
+        return []
+    syns = entry[1]
+    # PyDictionary rejects multi-word terms, so don't bother prefetching phrases.
+    return [s for s in syns if " " not in s][:limit]
@@ -20,6 +20,9 @@ run_app()
 
 Notes:
 - Network lookups are executed off the main thread; UI updates are marshalled onto Tk's mainloop.
+- Speech runs on one long-lived worker thread fed by a queue; "Speak" only enqueues text.
+- After each lookup, the top synonyms are prefetched in the background so follow-up searches are instant.
+- If NLTK is installed without its WordNet corpus, the corpus is downloaded in the background at startup.
 - Minimal aesthetic with built-in Tk; keep dependencies lean.
 =========================================================================================================
 """
@@ -30,8 +33,20 @@ import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 
-from .dictionary import lookup_word, format_word_summary
-from .tts import speak_text
+from .dictionary import (
+    cached_summary,
+    download_wordnet,
+    is_cached,
+    prefetch_summary,
+    related_words,
+    wordnet_downloadable,
+)
+from .tts import speak_text, stop_speaking
+
+# Very long results are inserted in pieces so the window keeps repainting.
+_INSERT_CHUNK = 4096
+# Prefetch work beyond this is dropped; only the latest search's neighbours are worth warming.
+_PREFETCH_BACKLOG = 16
 
 
 class SpeakMeaningApp(ttk.Frame):
@@ -42,8 +57,13 @@ class SpeakMeaningApp(ttk.Frame):
         self.master.minsize(640, 420)
 
         # State
-        self._result_q: "queue.Queue[str]" = queue.Queue()
         self._lookup_thread: threading.Thread | None = None
+        self._busy = False
+        self._idle_status = "Ready"
+        self._tts_q: "queue.Queue[str]" = queue.Queue()
+        threading.Thread(target=self._tts_worker, daemon=True).start()
+        self._prefetch_q: "queue.Queue[str]" = queue.Queue(maxsize=_PREFETCH_BACKLOG)
+        threading.Thread(target=self._prefetch_worker, daemon=True).start()
 
         # Widgets
         self._build_widgets()
@@ -52,6 +72,11 @@ class SpeakMeaningApp(ttk.Frame):
         # Key bindings
         self.entry_word.bind("<Return>", lambda _e: self.on_search())
 
+        # Searches work meanwhile; they use the web until the corpus is in place.
+        if wordnet_downloadable():
+            self._set_idle_status("Downloading offline dictionary...")
+            threading.Thread(target=self._wordnet_worker, daemon=True).start()
+
     def _build_widgets(self) -> None:
         # Top row: input + buttons
         row = ttk.Frame(self)
@@ -68,6 +93,9 @@ class SpeakMeaningApp(ttk.Frame):
         self.btn_speak = ttk.Button(row, text="Speak", command=self.on_speak, state="disabled")
         self.btn_speak.pack(side="left", padx=2)
 
+        self.btn_stop = ttk.Button(row, text="Stop", command=self.on_stop)
+        self.btn_stop.pack(side="left", padx=2)
+
         self.btn_clear = ttk.Button(row, text="Clear", command=self.on_clear)
         self.btn_clear.pack(side="left", padx=2)
 
@@ -79,6 +107,8 @@ class SpeakMeaningApp(ttk.Frame):
         frame_text.pack(fill="both", expand=True)
 
         self.text = tk.Text(frame_text, wrap="word", undo=False)
+        # Read-mostly output: skip undo bookkeeping entirely.
+        self.text.configure(autoseparators=False, maxundo=0, blockcursor=False)
         scroll = ttk.Scrollbar(frame_text, command=self.text.yview)
         self.text.configure(yscrollcommand=scroll.set)
 
@@ -91,14 +121,21 @@ class SpeakMeaningApp(ttk.Frame):
 
     # UI helpers
     def _set_busy(self, busy: bool) -> None:
+        self._busy = busy
         state = "disabled" if busy else "normal"
         self.btn_search.configure(state=state)
         self.btn_clear.configure(state=state)
         self.btn_exit.configure(state=state)
         self.entry_word.configure(state=state)
-        self.status.configure(text="Looking up..." if busy else "Ready")
+        self.status.configure(text="Looking up..." if busy else self._idle_status)
         self.master.configure(cursor="watch" if busy else "")
 
+    def _set_idle_status(self, text: str) -> None:
+        # Shown whenever no lookup is running; a running lookup's status takes precedence.
+        self._idle_status = text
+        if not self._busy:
+            self.status.configure(text=text)
+
     def on_search(self) -> None:
         word = self.entry_word.get().strip()
         if not word:
@@ -111,27 +148,32 @@ class SpeakMeaningApp(ttk.Frame):
         self._set_busy(True)
         self.text.delete("1.0", "end")
         self.btn_speak.configure(state="disabled")
+        self._drain(self._prefetch_q)  # Neighbours of the previous word are stale now
 
         def worker() -> None:
             try:
-                meanings, syns, ants = lookup_word(word)
-                summary = format_word_summary(word, meanings, syns, ants)
+                summary = cached_summary(word)
             except Exception as e:  # Safety net
                 summary = f"An error occurred while looking up the word:\n{e}"
-            self._result_q.put(summary)
+            # Marshal the result back onto Tk's mainloop
+            self.master.after(0, self._apply_result, summary)
+            for neighbor in related_words(word):
+                if not is_cached(neighbor):
+                    try:
+                        self._prefetch_q.put_nowait(neighbor)
+                    except queue.Full:
+                        break  # Prefetching is best effort
 
         self._lookup_thread = threading.Thread(target=worker, daemon=True)
         self._lookup_thread.start()
-        self.after(75, self._poll_results)
-
-    def _poll_results(self) -> None:
-        try:
-            summary = self._result_q.get_nowait()
-        except queue.Empty:
-            self.after(75, self._poll_results)
-            return
 
-        self.text.insert("1.0", summary + "\n")
+    def _apply_result(self, summary: str) -> None:
+        # The widget was cleared in on_search; appending avoids a prepend reflow.
+        text = summary + "\n"
+        for start in range(0, len(text), _INSERT_CHUNK):
+            if start:
+                self.text.update_idletasks()
+            self.text.insert("end", text[start : start + _INSERT_CHUNK])
         # Enable speak if we have something meaningful
         content = summary.strip().lower()
         can_speak = content and "error occurred" not in content
@@ -144,14 +186,50 @@ class SpeakMeaningApp(ttk.Frame):
             messagebox.showinfo("Info", "Nothing to speak.")
             return
 
-        # Speak asynchronously to avoid blocking UI
-        threading.Thread(target=speak_text, args=(content,), daemon=True).start()
+        # Hand off to the TTS worker to avoid blocking UI
+        self._tts_q.put(content)
+
+    def on_stop(self) -> None:
+        # Drop anything still waiting, then cut off the current utterance.
+        self._drain(self._tts_q)
+        stop_speaking()
+
+    @staticmethod
+    def _drain(q: "queue.Queue[str]") -> None:
+        try:
+            while True:
+                q.get_nowait()
+        except queue.Empty:
+            pass
+
+    def _tts_worker(self) -> None:
+        while True:
+            text = self._tts_q.get()
+            try:
+                speak_text(text)
+            except Exception:  # Keep the worker alive if the speech driver hiccups
+                pass
+
+    def _prefetch_worker(self) -> None:
+        while True:
+            word = self._prefetch_q.get()
+            if is_cached(word):
+                continue  # Already looked up since it was queued
+            try:
+                prefetch_summary(word)
+            except Exception:  # Best effort; a real search will surface errors
+                pass
+
+    def _wordnet_worker(self) -> None:
+        ready = download_wordnet()
+        status = "Ready" if ready else "Ready (offline dictionary unavailable; using the web)"
+        self.master.after(0, self._set_idle_status, status)
 
     def on_clear(self) -> None:
         self.text.delete("1.0", "end")
         self.entry_word.delete(0, "end")
         self.btn_speak.configure(state="disabled")
-        self.status.configure(text="Ready")
+        self.status.configure(text=self._idle_status)
 
 
 def run_app() -> None:
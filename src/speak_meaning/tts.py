@@ -20,30 +20,72 @@ speak_text("Hello world", rate=180, volume=0.9)
 Notes:
 - pyttsx3 is offline and uses platform-specific engines (SAPI5 on Windows, NSSpeechSynth on macOS, eSpeak on Linux).
 - Speaking is synchronous; call from a thread if you don't want to block the GUI.
+- Text is queued line by line (and sentence by sentence within a line) so playback starts after
+  the first piece is synthesized.
+- A single engine is created lazily and reused; calls are serialized because pyttsx3 is not re-entrant.
 =========================================================================================================
 """
 from __future__ import annotations
 
-import pyttsx3
-from typing import Optional
+import re
+import threading
+
+from typing import List, Optional
+
+try:
+    import pyttsx3  # type: ignore
+except Exception:  # pragma: no cover - import-time environment issues
+    pyttsx3 = None  # type: ignore
+
+# Line breaks separate the summary's headers, numbered definitions and term lists. Within a
+# line, split only where sentence punctuation is followed by a capitalized word, and never after
+# an enumerator such as "1." ("e.g. to flee" and "2. a race" stay whole).
+_LINE_BREAKS = re.compile(r"\n+")
+_SENTENCE_END = re.compile(r"(?<=[.!?])(?<!\d\.)\s+(?=[A-Z])")
+
+# Conservative defaults
+_DEFAULT_RATE = 175
+_DEFAULT_VOLUME = 0.9
+
+_ENGINE: Optional[pyttsx3.Engine] = None
+_ENGINE_LOCK = threading.Lock()
+
+
+def _segments(text: str) -> List[str]:
+    return [
+        seg
+        for line in _LINE_BREAKS.split(text)
+        for seg in (s.strip() for s in _SENTENCE_END.split(line))
+        if seg
+    ]
 
 
 def _engine() -> pyttsx3.Engine:
-    eng = pyttsx3.init()
-    # Conservative defaults
-    eng.setProperty("rate", 175)
-    eng.setProperty("volume", 0.9)
-    return eng
+    """Return the shared engine, initializing the platform driver on first use."""
+    global _ENGINE
+    if _ENGINE is None:
+        if pyttsx3 is None:
+            raise RuntimeError("pyttsx3 is not available. Please install it via `pip install pyttsx3`.")
+        _ENGINE = pyttsx3.init()
+    return _ENGINE
 
 
 def speak_text(text: str, rate: Optional[int] = None, volume: Optional[float] = None) -> None:
     if not text:
         return
-    eng = _engine()
-    if rate is not None:
-        eng.setProperty("rate", rate)
-    if volume is not None:
-        eng.setProperty("volume", volume)
-    eng.say(text)
-    eng.runAndWait()
-    eng.stop()
+    with _ENGINE_LOCK:
+        eng = _engine()
+        # Always set both so a previous call's overrides don't leak into this one.
+        eng.setProperty("rate", _DEFAULT_RATE if rate is None else rate)
+        eng.setProperty("volume", _DEFAULT_VOLUME if volume is None else volume)
+        # One utterance per sentence: the engine speaks the first while the rest are still queued.
+        for segment in _segments(text):
+            eng.say(segment)
+        eng.runAndWait()
+
+
+def stop_speaking() -> None:
+    """Interrupt the current utterance; safe to call from any thread."""
+    eng = _ENGINE
+    if eng is not None:
+        eng.stop()
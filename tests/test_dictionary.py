@@ -4,13 +4,20 @@
 Basic unit tests for dictionary formatting helpers.
 Network calls are avoided by stubbing DictionaryClient methods.
 """
-import builtins
+import sys
 import types
 
-import pytest
-
 from speak_meaning import __version__
-from speak_meaning.dictionary import format_meanings, format_word_summary
+from speak_meaning import dictionary
+from speak_meaning.dictionary import (
+    DictionaryClient,
+    _compact_meanings,
+    _DiskCache,
+    _TinyLFUCache,
+    _unique_terms,
+    format_meanings,
+    format_word_summary,
+)
 
 
 def test_version_semver_like():
@@ -42,3 +49,356 @@ def test_format_word_summary_contains_sections():
     assert "Definitions:" in out
     assert "Synonyms:" in out
     assert "Antonyms:" in out
+
+
+def test_disk_cache_roundtrip(tmp_path):
+    cache = _DiskCache(str(tmp_path / "cache" / "lookups.sqlite3"))
+    assert cache.get("word") is None
+    cache.put("word", ({"Noun": ["a unit of language"]}, ["term"], []))
+    assert cache.get("word") == ((("Noun", ("a unit of language",)),), ["term"], [])
+
+    # A second connection to the same file sees the persisted entry.
+    again = _DiskCache(str(tmp_path / "cache" / "lookups.sqlite3"))
+    assert again.get("word") == ((("Noun", ("a unit of language",)),), ["term"], [])
+
+
+def test_tinylfu_keeps_hot_keys_through_a_scan():
+    cache = _TinyLFUCache(maxsize=100)
+    for _ in range(5):
+        cache.put("hot", 1)
+        assert cache.get("hot") == 1
+    for i in range(1000):
+        cache.put(f"cold{i}", i)
+    assert cache.get("hot") == 1
+    assert len(cache) <= 100
+    assert cache.get("missing", "default") == "default"
+
+
+def test_normalize_word_is_canonical():
+    norm = DictionaryClient._normalize_word
+    assert norm("Algorithm") == norm(" algorithm ") == "algorithm"
+    assert norm("STRASSE") == norm("Straße".upper())
+    assert norm("ÉTUDE") == "étude"
+    assert norm("") == norm(None) == ""  # type: ignore[arg-type]
+
+
+def test_unique_terms_dedups_in_order():
+    assert _unique_terms(["beta ", "alpha", "beta", "", None, "  "]) == ["beta", "alpha"]  # type: ignore[list-item]
+
+
+def test_tinylfu_expires_entries_with_ttl():
+    cache = _TinyLFUCache(maxsize=10)
+    cache.put("negative", [], ttl=0)
+    cache.put("positive", ["term"], ttl=3600)
+    assert "negative" not in cache
+    assert cache.get("negative", "miss") == "miss"
+    assert cache.get("positive") == ["term"]
+
+
+def test_tinylfu_peek_does_not_count_as_an_access():
+    cache = _TinyLFUCache(maxsize=3)  # 1-slot window in front of a 2-slot main segment
+    for key in ("a", "b", "c"):
+        cache.put(key, key.upper())
+    assert cache.peek("a") == "A" and cache.peek("a") == "A"
+    assert cache.peek("missing", "miss") == "miss"
+    # "c" leaves the window and challenges "a"; had the peeks counted, "a" would have won.
+    cache.put("d", "D")
+    assert "a" not in cache
+    assert "c" in cache
+
+
+def test_related_words_only_from_cache(monkeypatch):
+    monkeypatch.setattr(dictionary, "_SUMMARY_CACHE", _TinyLFUCache(maxsize=10))
+    monkeypatch.setattr(
+        dictionary,
+        "_lookup_with_status",
+        lambda word: (({"Noun": ["a test"]}, ["exam", "quiz", "trial run"], ["answer"]), True),
+    )
+    assert dictionary.related_words("Test") == []
+    assert not dictionary.is_cached("test")
+
+    summary = dictionary.cached_summary(" Test ")
+    assert summary == format_word_summary(
+        "Test", {"Noun": ["a test"]}, ["exam", "quiz", "trial run"], ["answer"]
+    )
+    assert dictionary.is_cached(" TEST ")
+    assert dictionary.cached_summary("test").startswith("Word: test\n")
+    assert dictionary.related_words("test") == ["exam", "quiz"]
+
+
+class _FakeBackend:
+    """PyDictionary stand-in that counts calls; synonym() can fail a set number of times."""
+
+    def __init__(self, synonym_failures=0, synonyms=("term",)):
+        self.synonym_failures = synonym_failures
+        self.synonyms = synonyms
+        self.calls = {"meaning": 0, "synonym": 0, "antonym": 0}
+
+    def meaning(self, word):
+        self.calls["meaning"] += 1
+        return {"Noun": ["a unit of language"]}
+
+    def synonym(self, word):
+        self.calls["synonym"] += 1
+        if self.synonym_failures:
+            self.synonym_failures -= 1
+            raise ConnectionError("synonym.com unreachable")
+        return None if self.synonyms is None else list(self.synonyms)
+
+    def antonym(self, word):
+        # PyDictionary returns None when a word has no antonyms.
+        self.calls["antonym"] += 1
+        return None
+
+
+WORD_RESULT = ((("Noun", ("a unit of language",)),), ["term"], [])
+
+
+def _client(tmp_path, backend, wordnet=None):
+    return DictionaryClient(
+        backend=backend, disk=_DiskCache(str(tmp_path / "lookups.sqlite3")), wordnet=wordnet
+    )
+
+
+class _FakeLemma:
+    def __init__(self, name, antonyms=()):
+        self._name, self._antonyms = name, antonyms
+
+    def name(self):
+        return self._name
+
+    def antonyms(self):
+        return [_FakeLemma(a) for a in self._antonyms]
+
+
+class _FakeSynset:
+    def __init__(self, pos, definition, lemmas):
+        self._pos, self._definition, self._lemmas = pos, definition, lemmas
+
+    def pos(self):
+        return self._pos
+
+    def definition(self):
+        return self._definition
+
+    def lemmas(self):
+        return self._lemmas
+
+
+_SYNSETS = {
+    "happy": [
+        _FakeSynset("a", "enjoying well-being", [_FakeLemma("happy", ["unhappy"])]),
+        _FakeSynset("s", "marked by good fortune", [_FakeLemma("felicitous"), _FakeLemma("happy")]),
+    ],
+    "ice_cream": [_FakeSynset("n", "frozen dessert", [_FakeLemma("ice_cream"), _FakeLemma("icecream")])],
+}
+
+
+def test_wordnet_answers_without_the_network(tmp_path):
+    backend = _FakeBackend()
+    wordnet = types.SimpleNamespace(synsets=lambda word: _SYNSETS.get(word, []))
+    client = _client(tmp_path, backend, wordnet=wordnet)
+
+    meanings, syns, ants = client.lookup("Happy")
+    assert meanings == (("Adjective", ("enjoying well-being", "marked by good fortune")),)
+    assert syns == ["felicitous"]
+    assert ants == ["unhappy"]
+    assert client.lookup("ice cream") == ((("Noun", ("frozen dessert",)),), ["icecream"], [])
+    assert backend.calls == {"meaning": 0, "synonym": 0, "antonym": 0}
+
+    # Words WordNet doesn't know fall back to PyDictionary.
+    assert client.lookup("word") == WORD_RESULT
+    assert backend.calls["meaning"] == 1
+
+
+def test_wordnet_takes_precedence_over_disk_rows(tmp_path):
+    disk = _DiskCache(str(tmp_path / "lookups.sqlite3"))
+    disk.put("happy", ((("Adjective", ("from the web",)),), [], []))
+    wordnet = types.SimpleNamespace(synsets=lambda word: _SYNSETS.get(word, []))
+    client = DictionaryClient(backend=_FakeBackend(), disk=disk, wordnet=wordnet)
+
+    assert client.meanings("happy")[0][1][0] == "enjoying well-being"
+    # WordNet answers are local already, so they aren't copied to disk.
+    client.lookup("ice cream")
+    assert disk.get("ice cream") is None
+
+
+class _MissingCorpus:
+    """NLTK reader whose corpus isn't installed until `installed` is set."""
+
+    installed = False
+
+    def ensure_loaded(self):
+        if not self.installed:
+            raise LookupError("Resource wordnet not found.")
+
+    def synsets(self, word):
+        return _SYNSETS.get(word, [])
+
+
+def test_lookups_never_download_wordnet(tmp_path, monkeypatch):
+    reader = _MissingCorpus()
+    downloads = []
+
+    def download(name, quiet=False):
+        downloads.append(name)
+        reader.installed = True
+        return True
+
+    monkeypatch.setattr(dictionary, "wordnet", reader)
+    monkeypatch.setattr(dictionary, "nltk", types.SimpleNamespace(download=download), raising=False)
+    client = DictionaryClient(backend=_FakeBackend(), disk=_DiskCache(str(tmp_path / "l.sqlite3")))
+
+    assert client.synonyms("happy") == ["term"]  # From PyDictionary
+    assert downloads == []
+
+    assert dictionary.wordnet_downloadable()
+    assert dictionary.download_wordnet()
+    assert downloads == ["wordnet"]
+    assert not dictionary.wordnet_downloadable()
+    # The already-built client uses the corpus as soon as it's installed.
+    assert client.synonyms("ice cream") == ["icecream"]
+
+
+def test_format_meanings_accepts_compact_pairs():
+    m = {"Verb": ["to do something"], "Noun": ["a thing", "", None]}
+    compact = _compact_meanings(m)
+    assert compact == (("Verb", ("to do something",)), ("Noun", ("a thing",)))
+    assert format_meanings(compact) == format_meanings({"Noun": ["a thing"], "Verb": ["to do something"]})
+
+
+def test_transient_failure_is_not_pinned(tmp_path, monkeypatch):
+    monkeypatch.setattr(dictionary, "_NEGATIVE_TTL", 0)  # expire negative entries at once
+    backend = _FakeBackend(synonym_failures=1)
+    client = _client(tmp_path, backend)
+
+    assert client.synonyms("word") == []
+    assert _DiskCache(str(tmp_path / "lookups.sqlite3")).get("word") is None  # not persisted
+    assert client.synonyms("word") == ["term"]  # retried once the short TTL lapsed
+    assert backend.calls["synonym"] == 2
+
+    other = _FakeBackend()
+    assert _client(tmp_path, other).lookup("word") == WORD_RESULT
+    assert other.calls["meaning"] == 0  # the recovered result was persisted
+
+
+def test_missing_antonyms_are_a_complete_result(tmp_path, monkeypatch):
+    monkeypatch.setattr(dictionary, "_NEGATIVE_TTL", 0)
+    backend = _FakeBackend()
+    client = _client(tmp_path, backend)
+
+    assert client.lookup("word") == WORD_RESULT
+    assert client.lookup("word") == WORD_RESULT  # served by L1 with the long TTL
+    assert backend.calls == {"meaning": 1, "synonym": 1, "antonym": 1}
+
+    # A fresh process (new client, empty L1) is answered from disk.
+    other = _FakeBackend()
+    assert _client(tmp_path, other).lookup("word") == WORD_RESULT
+    assert other.calls == {"meaning": 0, "synonym": 0, "antonym": 0}
+
+
+def test_word_without_synonyms_is_persisted(tmp_path):
+    # PyDictionary's synonym() returns None when synonym.com lists nothing for a word.
+    client = _client(tmp_path, _FakeBackend(synonyms=None))
+    assert client.lookup("word") == ((("Noun", ("a unit of language",)),), [], [])
+
+    other = _FakeBackend()
+    assert _client(tmp_path, other).lookup("word") == ((("Noun", ("a unit of language",)),), [], [])
+    assert other.calls["meaning"] == 0
+
+
+def test_disk_rows_expire(tmp_path, monkeypatch):
+    disk = _DiskCache(str(tmp_path / "lookups.sqlite3"))
+    disk.put("word", WORD_RESULT)
+    assert disk.get("word") == WORD_RESULT
+    monkeypatch.setattr(dictionary, "_DISK_TTL", 0)
+    assert disk.get("word") is None
+
+
+def test_prefetch_does_not_use_the_shared_fetch_pool(tmp_path, monkeypatch):
+    class _NoPool:
+        def submit(self, *args, **kwargs):
+            raise AssertionError("prefetch must not use _FETCH_POOL")
+
+    client = _client(tmp_path, _FakeBackend())
+    monkeypatch.setattr(dictionary, "_FETCH_POOL", _NoPool())
+    monkeypatch.setattr(dictionary, "_SUMMARY_CACHE", _TinyLFUCache(maxsize=10))
+    monkeypatch.setattr(dictionary, "_client", lambda: client)
+
+    dictionary.prefetch_summary("word")
+    assert dictionary.is_cached("word")
+
+
+def test_prefetch_does_not_outrank_searched_words(tmp_path, monkeypatch):
+    client = _client(tmp_path, _FakeBackend())
+    monkeypatch.setattr(dictionary, "_SUMMARY_CACHE", _TinyLFUCache(maxsize=3))
+    monkeypatch.setattr(dictionary, "_client", lambda: client)
+
+    for word in ("a", "b", "c"):
+        dictionary.cached_summary(word)
+    dictionary.prefetch_summary("x")
+    dictionary.prefetch_summary("y")
+
+    # A prefetched word has no recorded accesses, so it can't displace one the user searched.
+    assert dictionary.is_cached("b")
+    assert not dictionary.is_cached("x")
+
+
+class _FakeSession:
+    """requests.Session stand-in that records GETs and mounted adapters."""
+
+    def __init__(self):
+        self.gets, self.mounts = [], {}
+
+    def mount(self, prefix, adapter):
+        self.mounts[prefix] = adapter
+
+    def get(self, url, **kwargs):
+        self.gets.append((url, kwargs))
+        return "response"
+
+
+def _fake_requests(monkeypatch):
+    sessions = []
+
+    def session():
+        sessions.append(_FakeSession())
+        return sessions[-1]
+
+    fake = types.SimpleNamespace(Session=session, codes="codes", sessions=sessions)
+    monkeypatch.setattr(dictionary, "requests", fake)
+    monkeypatch.setattr(dictionary, "HTTPAdapter", lambda **kwargs: kwargs, raising=False)
+    return fake
+
+
+def test_shared_session_routes_pydictionary_gets(monkeypatch):
+    fake = _fake_requests(monkeypatch)
+    utils = types.ModuleType("PyDictionary.utils")
+    utils.requests = fake
+    monkeypatch.setitem(sys.modules, "PyDictionary.utils", utils)
+
+    dictionary._install_shared_session.__wrapped__()
+
+    assert utils.requests is not fake
+    assert utils.requests.get("https://example.org/a") == "response"
+    utils.requests.get("https://example.org/b", timeout=3)
+    [session] = fake.sessions
+    assert session.gets == [
+        ("https://example.org/a", {"timeout": dictionary._HTTP_TIMEOUT}),
+        ("https://example.org/b", {"timeout": 3}),
+    ]
+    assert set(session.mounts) == {"https://", "http://"}
+    assert utils.requests.codes == "codes"  # Everything else still comes from requests
+
+
+def test_shared_session_leaves_unknown_layouts_alone(monkeypatch):
+    fake = _fake_requests(monkeypatch)
+    utils = types.ModuleType("PyDictionary.utils")
+    other = types.SimpleNamespace(get=lambda url: "direct")
+    utils.requests = other
+    monkeypatch.setitem(sys.modules, "PyDictionary.utils", utils)
+
+    dictionary._install_shared_session.__wrapped__()
+
+    assert utils.requests is other
+    assert fake.sessions == []
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Unit tests for how text is split into utterances before it is spoken.
+"""
+from speak_meaning.dictionary import format_word_summary
+from speak_meaning.tts import _segments
+
+
+def test_segments_follow_summary_lines():
+    summary = format_word_summary(
+        "Run",
+        {"Noun": ["a score in baseball", "a race"], "Verb": ["move fast e.g. to flee"]},
+        ["dash", "sprint"],
+        [],
+    )
+    assert _segments(summary) == [
+        "Word: Run",
+        "Definitions:",
+        "Noun:",
+        "1. a score in baseball",
+        "2. a race",
+        "Verb:",
+        "1. move fast e.g. to flee",
+        "Synonyms:",
+        "dash, sprint",
+    ]
+
+
+def test_segments_split_sentences_within_a_line():
+    assert _segments("It ran. Then it stopped!  Why?\n\nDone") == [
+        "It ran.",
+        "Then it stopped!",
+        "Why?",
+        "Done",
+    ]